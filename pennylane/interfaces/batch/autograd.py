@@ -17,6 +17,7 @@ to a PennyLane Device class.
 """
 # pylint: disable=too-many-arguments
 import inspect
+import itertools
 
 import autograd
 from autograd.numpy.numpy_boxes import ArrayBox
@@ -51,14 +52,23 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
         list[list[float]]: A nested list of tape results. Each element in
         the returned list corresponds in order to the provided tapes.
     """
+    parameters = []
+
     for tape in tapes:
         # set the trainable parameters
         params = tape.get_parameters(trainable_only=False)
         tape.trainable_params = qml.math.get_trainable_indices(params)
 
-    parameters = autograd.builtins.tuple(
-        [autograd.builtins.list(t.get_parameters()) for t in tapes]
-    )
+        # only the trainable parameters are passed to _execute
+        parameters.append(autograd.builtins.list([params[i] for i in tape.trainable_params]))
+
+    parameters = autograd.builtins.tuple(parameters)
+
+    # Temporary: check if the gradient function is a differentiable transform.
+    # For the moment, simply check if it is part of the `qml.gradients` package.
+    # Longer term, we should have a way of checking this directly
+    # (e.g., isinstance(gradient_fn, GradientTransform)).
+    module_name = getattr(inspect.getmodule(gradient_fn), "__name__", "")
 
     return _execute(
         parameters,
@@ -69,6 +79,7 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
         gradient_kwargs=gradient_kwargs,
         _n=_n,
         max_diff=max_diff,
+        _is_gradient_transform="pennylane.gradients" in module_name,
     )[0]
 
 
@@ -82,6 +93,7 @@ def _execute(
     gradient_kwargs=None,
     _n=1,
     max_diff=2,
+    _is_gradient_transform=False,
 ):  # pylint: disable=dangerous-default-value,unused-argument
     """Autodifferentiable wrapper around ``Device.batch_execute``.
 
@@ -102,6 +114,9 @@ def _execute(
     The private argument ``_n`` is used to track nesting of derivatives, for example
     if the nth-order derivative is requested. Do not set this argument unless you
     understand the consequences!
+
+    The private argument ``_is_gradient_transform`` indicates whether ``gradient_fn``
+    is a differentiable gradient transform; it is determined by :func:`execute`.
     """
     with qml.tape.Unwrap(*tapes):
         res, jacs = execute_fn(tapes, **gradient_kwargs)
@@ -116,6 +131,55 @@ def _execute(
     return res, jacs
 
 
+def _compute_vjps(dy, jacs):
+    """Compute the vector-Jacobian products of a batch of tapes.
+
+    Contiguous tapes whose output gradients and Jacobians share the same shapes
+    are stacked, and their vector-Jacobian products are computed using a single
+    tensor contraction. Tapes that cannot be grouped fall back to
+    :func:`~.compute_vjp`.
+
+    Args:
+        dy (Sequence[tensor_like]): the output gradients of each tape
+        jacs (Sequence[tensor_like or None]): the Jacobian of each tape
+
+    Returns:
+        list[tensor_like or None]: the vector-Jacobian product of each tape
+    """
+
+    def shapes(pair):
+        d, jac = pair
+        return None if jac is None else (qml.math.shape(d), qml.math.shape(jac))
+
+    vjps = []
+
+    for key, group in itertools.groupby(zip(dy, jacs), key=shapes):
+        group = list(group)
+
+        if key is None or len(group) == 1:
+            vjps.extend(qml.gradients.compute_vjp(d, jac) for d, jac in group)
+            continue
+
+        num_tapes = len(group)
+        dy_stack = qml.math.stack([d for d, _ in group])
+        jac_stack = qml.math.stack([jac for _, jac in group])
+
+        # flatten the output dimensions of each tape, as is done by compute_vjp
+        dy_stack = qml.math.reshape(dy_stack, [num_tapes, -1, 1])
+        jac_stack = qml.math.reshape(jac_stack, [num_tapes, dy_stack.shape[1], -1])
+
+        # contract the output dimension of each tape
+        vjp_stack = qml.math.sum(dy_stack * jac_stack, axis=1)
+
+        if isinstance(vjp_stack, np.tensor):
+            # compute_vjp contracts using NumPy, which returns plain arrays for
+            # PennyLane tensors; unwrap so that both paths return the same type
+            vjp_stack = vjp_stack.unwrap()
+        vjps.extend(vjp_stack[i] for i in range(num_tapes))
+
+    return vjps
+
+
 def vjp(
     ans,
     parameters,
@@ -126,6 +190,7 @@ def vjp(
     gradient_kwargs=None,
     _n=1,
     max_diff=2,
+    _is_gradient_transform=False,
 ):  # pylint: disable=dangerous-default-value,unused-argument
     """Returns the vector-Jacobian product operator for a batch of quantum tapes.
 
@@ -150,6 +215,8 @@ def vjp(
             the maximum number of derivatives to support. Increasing this value allows
             for higher order derivatives to be extracted, at the cost of additional
             (classical) computational overhead during the backwards pass.
+        _is_gradient_transform (bool): whether ``gradient_fn`` is a differentiable
+            gradient transform
 
     Returns:
         function: this function accepts the backpropagation
@@ -166,18 +233,12 @@ def vjp(
         if jacs:
             # Jacobians were computed on the forward pass (mode="forward")
             # No additional quantum evaluations needed; simply compute the VJPs directly.
-            vjps = [qml.gradients.compute_vjp(d, jac) for d, jac in zip(dy, jacs)]
+            vjps = _compute_vjps(dy, jacs)
 
         else:
             # Need to compute the Jacobians on the backward pass (accumulation="backward")
 
-            # Temporary: check if the gradient function is a differentiable transform.
-            # For the moment, simply check if it is part of the `qml.gradients` package.
-            # Longer term, we should have a way of checking this directly
-            # (e.g., isinstance(gradient_fn, GradientTransform))
-            module_name = getattr(inspect.getmodule(gradient_fn), "__name__", "")
-
-            if "pennylane.gradients" in module_name:
+            if _is_gradient_transform:
 
                 # Generate and execute the required gradient tapes
                 if _n == max_diff:
@@ -228,7 +289,7 @@ def vjp(
                 with qml.tape.Unwrap(*tapes):
                     jacs = gradient_fn(tapes, **gradient_kwargs)
 
-                vjps = [qml.gradients.compute_vjp(d, jac) for d, jac in zip(dy, jacs)]
+                vjps = _compute_vjps(dy, jacs)
 
             else:
                 raise ValueError("Unknown gradient function.")
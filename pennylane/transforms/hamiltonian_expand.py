@@ -143,34 +143,60 @@ def hamiltonian_expand(tape, group=True):
             [hamiltonian.ops[i] for i in indices] for indices in hamiltonian.grouping_indices
         ]
 
-        tapes = []
-        for obs in obs_groupings:
-
-            with tape.__class__() as new_tape:
-                for op in tape.operations:
-                    op.queue()
-
-                for o in obs:
-                    qml.expval(o)
-
-            new_tape = new_tape.expand(stop_at=lambda obj: True)
-            tapes.append(new_tape)
+        # if all groups are of the same size, their coefficients
+        # are flattened into a single vector
+        coeffs_shapes = {qml.math.shape(c) for c in coeffs}
+        coeffs_shape = coeffs_shapes.pop() if len(coeffs_shapes) == 1 else None
+        flat_coeffs = (
+            None if coeffs_shape is None else qml.math.reshape(qml.math.stack(coeffs), [-1])
+        )
     else:
+        # each observable forms its own group, with a scalar
+        # coefficient; the coefficients are kept as a single tensor
         coeffs = hamiltonian.coeffs
+        coeffs_shape = ()
+        flat_coeffs = qml.math.reshape(coeffs, [-1])
+        obs_groupings = [[o] for o in hamiltonian.ops]
+
+    tapes = []
+    for obs in obs_groupings:
+
+        # the new tape shares the operations of the original tape,
+        # and only measures the observables of the group
+        new_tape = tape.__class__()
+        new_tape._prep = tape._prep.copy()
+        new_tape._ops = tape._ops.copy()
+        new_tape._measurements = [
+            qml.measure.MeasurementProcess(qml.operation.Expectation, obs=o) for o in obs
+        ]
+        new_tape._update()
 
-        tapes = []
-        for o in hamiltonian.ops:
-            with tape.__class__() as new_tape:
-                for op in tape.operations:
-                    op.queue()
-                qml.expval(o)
+        if new_tape._obs_sharing_wires:
+            # Since no operations are expanded, the expansion only serves to
+            # diagonalize observables within the group that share wires. Groups
+            # without such observables are identical to their expansion.
+            new_tape = new_tape.expand(stop_at=lambda obj: True)
 
-            tapes.append(new_tape)
+        # the output dimension is not carried over by the tape expansion
+        new_tape._output_dim = len(obs)
+        tapes.append(new_tape)
 
     def processing_fn(res):
         # note: res could have an extra dimension here if a shots_distribution
         # is used for evaluation
-        dot_products = [qml.math.dot(qml.math.squeeze(r), c) for c, r in zip(coeffs, res)]
-        return qml.math.sum(qml.math.stack(dot_products), axis=0)
+        res = [qml.math.squeeze(r) for r in res]
+
+        if coeffs_shape is not None and all(qml.math.shape(r) == coeffs_shape for r in res):
+            # All groups and their coefficients share the same shape; the expectation
+            # value can be computed using a single dot product over all terms.
+            return qml.math.dot(qml.math.reshape(qml.math.stack(res), [-1]), flat_coeffs)
+
+        # accumulate the contribution of each group
+        expval = 0
+
+        for c, r in zip(coeffs, res):
+            expval = expval + qml.math.dot(r, c)
+
+        return expval
 
     return tapes, processing_fn
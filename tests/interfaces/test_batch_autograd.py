@@ -20,6 +20,7 @@ from pennylane import numpy as np
 import pennylane as qml
 from pennylane.gradients import param_shift
 from pennylane.interfaces.batch import execute
+from pennylane.interfaces.batch.autograd import _compute_vjps
 
 
 class TestAutogradExecuteUnitTests:
@@ -159,6 +160,59 @@ class TestAutogradExecuteUnitTests:
         spy_gradients.assert_called()
 
 
+class TestComputeVJPs:
+    """Unit tests for computing the VJPs of a batch of tapes"""
+
+    def test_matches_compute_vjp(self, tol):
+        """Test that grouping tapes with matching shapes gives the same
+        result as computing the VJP of each tape separately"""
+        dy = [np.array([1.0, 2.0]), np.array([0.5, -1.0]), np.array(3.0), np.array([1.0, 1.0])]
+        jacs = [
+            np.array([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]),
+            np.array([[-0.1, 0.7, 0.2], [0.3, 0.0, 0.9]]),
+            np.array([0.2, 0.4]),
+            None,
+        ]
+
+        res = _compute_vjps(dy, jacs)
+        expected = [qml.gradients.compute_vjp(d, jac) for d, jac in zip(dy, jacs)]
+
+        assert len(res) == len(expected)
+        assert res[-1] is None
+
+        for r, e in zip(res[:-1], expected[:-1]):
+            assert type(r) is type(e)
+            assert np.allclose(r, e, atol=tol, rtol=0)
+
+    def test_batched_tapes_gradient(self, tol):
+        """Test that the gradient of several tapes with identically shaped
+        outputs is correct when using device gradients"""
+        dev = qml.device("default.qubit", wires=1)
+
+        def cost(a):
+            tapes = []
+
+            for i in range(len(a)):
+                with qml.tape.JacobianTape() as tape:
+                    qml.RX(a[i], wires=0)
+                    qml.expval(qml.PauliZ(0))
+
+                tapes.append(tape)
+
+            res = execute(
+                tapes,
+                dev,
+                gradient_fn="device",
+                gradient_kwargs={"method": "adjoint_jacobian", "use_device_state": True},
+            )
+            return res[0][0] + 2 * res[1][0] + 3 * res[2][0]
+
+        a = np.array([0.1, 0.2, 0.3], requires_grad=True)
+        res = qml.grad(cost)(a)
+        expected = -np.array([1, 2, 3]) * np.sin(a)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+
 class TestCaching:
     """Test for caching behaviour"""
 
@@ -131,6 +131,144 @@ class TestHamiltonianExpval:
         tapes, fn = qml.transforms.hamiltonian_expand(tape, group=True)
         assert len(tapes) == 2
 
+    def test_processing_fn_uniform_groups(self):
+        """Tests that the processing function is correct when all groups
+        share the same shape, with and without a shot dimension"""
+        H = qml.Hamiltonian([1.0, 2.0, 3.0], [qml.PauliZ(0), qml.PauliX(1), qml.PauliX(0)])
+
+        with qml.tape.QuantumTape() as tape:
+            qml.Hadamard(wires=0)
+            qml.expval(H)
+
+        tapes, fn = qml.transforms.hamiltonian_expand(tape, group=False)
+
+        res = [np.array([0.5]), np.array([0.2]), np.array([-1.0])]
+        assert np.isclose(fn(res), 0.5 + 0.4 - 3.0)
+
+        # results with an additional shot dimension
+        res = [np.array([[0.5], [0.1]]), np.array([[0.2], [0.3]]), np.array([[-1.0], [0.4]])]
+        assert np.allclose(fn(res), [0.5 + 0.4 - 3.0, 0.1 + 0.6 + 1.2])
+
+    def test_processing_fn_uniform_multi_term_groups(self, mocker):
+        """Tests that the processing function is correct when all groups
+        contain the same number of observables"""
+        coeffs = np.array([1.0, 2.0, 3.0, 4.0])
+        obs = [qml.PauliZ(0), qml.PauliZ(1), qml.PauliX(0), qml.PauliX(1)]
+        H = qml.Hamiltonian(coeffs, obs, grouping_type="qwc")
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RY(0.3, wires=0)
+            qml.RY(-0.2, wires=1)
+            qml.expval(H)
+
+        tapes, fn = qml.transforms.hamiltonian_expand(tape)
+        assert [len(t.measurements) for t in tapes] == [2, 2]
+
+        res = dev.batch_execute(tapes)
+        expected = sum(np.dot(r, coeffs[idx]) for r, idx in zip(res, H.grouping_indices))
+
+        spy = mocker.spy(qml.math, "stack")
+        assert np.isclose(fn(res), expected)
+        spy.assert_called()
+
+        expected = np.cos(0.3) + 2 * np.cos(0.2) + 3 * np.sin(0.3) - 4 * np.sin(0.2)
+        assert np.isclose(fn(res), expected)
+
+    def test_processing_fn_mixed_size_groups(self, mocker):
+        """Tests that the processing function falls back to computing each group
+        separately when the groups contain different numbers of observables"""
+        coeffs = np.array([1.0, 2.0, 3.0])
+        obs = [qml.PauliZ(0), qml.PauliX(1), qml.PauliX(0)]
+        H = qml.Hamiltonian(coeffs, obs, grouping_type="qwc")
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RY(0.3, wires=0)
+            qml.RY(-0.2, wires=1)
+            qml.expval(H)
+
+        tapes, fn = qml.transforms.hamiltonian_expand(tape)
+        assert sorted(len(t.measurements) for t in tapes) == [1, 2]
+
+        res = dev.batch_execute(tapes)
+
+        spy = mocker.spy(qml.math, "stack")
+        expected = np.cos(0.3) - 2 * np.sin(0.2) + 3 * np.sin(0.3)
+        assert np.isclose(fn(res), expected)
+        spy.assert_not_called()
+
+    @pytest.mark.parametrize("group", [True, False])
+    def test_processing_fn_shot_vector(self, group, mocker):
+        """Tests that the processing function accumulates the contribution of each
+        group when a shot vector is used, returning one expectation value per shot batch"""
+        shot_vector = [10, 20, 30]
+        shot_dev = qml.device("default.qubit", wires=2, shots=shot_vector)
+
+        obs = [qml.PauliZ(0), qml.PauliZ(1), qml.PauliZ(0) @ qml.PauliZ(1)]
+        H = qml.Hamiltonian([1.0, 2.0, 3.0], obs)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.PauliX(wires=0)
+            qml.expval(H)
+
+        tapes, fn = qml.transforms.hamiltonian_expand(tape, group=group)
+        res = shot_dev.batch_execute(tapes)
+
+        spy = mocker.spy(qml.math, "stack")
+        expval = fn(res)
+        spy.assert_not_called()
+
+        assert expval.shape == (len(shot_vector),)
+        assert np.allclose(expval, -1.0 + 2.0 - 3.0)
+
+    def test_expansion_only_for_shared_wires(self, mocker):
+        """Tests that tapes are only expanded if observables within
+        a group share wires"""
+        H1 = qml.Hamiltonian([1.0, 2.0], [qml.PauliZ(0), qml.PauliX(1)], grouping_type="qwc")
+        H2 = qml.Hamiltonian(
+            [1.0, 2.0], [qml.PauliZ(0), qml.PauliZ(0) @ qml.PauliZ(1)], grouping_type="qwc"
+        )
+
+        with qml.tape.QuantumTape() as tape1:
+            qml.Hadamard(wires=0)
+            qml.expval(H1)
+
+        with qml.tape.QuantumTape() as tape2:
+            qml.Hadamard(wires=0)
+            qml.expval(H2)
+
+        spy = mocker.spy(qml.tape.QuantumTape, "expand")
+
+        tapes, fn = qml.transforms.hamiltonian_expand(tape1)
+        assert len(tapes) == 1
+        spy.assert_not_called()
+        assert tapes[0].output_dim == len(tapes[0].measurements) == 2
+
+        tapes, fn = qml.transforms.hamiltonian_expand(tape2)
+        assert len(tapes) == 1
+        spy.assert_called()
+        assert tapes[0].output_dim == len(tapes[0].measurements) == 2
+
+        res = dev.batch_execute(tapes)
+        assert np.isclose(fn(res), 0.0)
+
+    @pytest.mark.parametrize("group", [True, False])
+    def test_inverse_operations_preserved(self, group):
+        """Tests that inverted operations on the input tape remain inverted,
+        both on the generated tapes and on the original tape"""
+        H = qml.Hamiltonian([1.0, 3.0], [qml.PauliZ(0), qml.PauliX(0)])
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RY(0.7, wires=0).inv()
+            qml.expval(H)
+
+        tapes, fn = qml.transforms.hamiltonian_expand(tape, group=group)
+
+        assert tape.operations[0].inverse
+        assert all(t.operations[0].inverse for t in tapes)
+
+        expected = np.cos(0.7) - 3 * np.sin(0.7)
+        assert np.isclose(fn(dev.batch_execute(tapes)), expected)
+
     def test_hamiltonian_error(self):
 
         with pennylane.tape.QuantumTape() as tape: